@@ -11,21 +11,174 @@ License: MIT
 
 import os
 import sys
+import fcntl
+import struct
+import copy
+import collections
+import contextlib
 import json
+import hashlib
+import random
+import re
 import subprocess
-import tarfile
 import logging
+import logging.handlers
+import queue
+import atexit
 import time
 import shutil
-from datetime import datetime, timedelta
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-import argparse
+from typing import Callable, List, Dict, Optional, Tuple
+
+try:
+    import zstandard  # Optional: zstd compression without the zstd command-line tool
+except ImportError:
+    zstandard = None
+
+
+# Buffer size for Python-side compression I/O (multi-GB OVA files)
+COMPRESS_BUFFER_SIZE = 4 * 1024 * 1024
+
+# One line of 'VBoxManage list vms' output: "vm_name" {uuid}
+# The name match is greedy so names containing double quotes are kept intact
+_VM_LINE_RE = re.compile(rb'^"(?P<name>.*)"\s+\{(?P<uuid>[0-9a-fA-F-]+)\}\s*$')
+
+# VMState line of 'VBoxManage showvminfo --machinereadable' output
+_VMSTATE_RE = re.compile(rb'^VMState="([^"]+)"', re.MULTILINE)
+
+# Progress ("0%...10%...") and status lines printed by long-running VBoxManage commands
+_PROGRESS_LINE_RE = re.compile(rb'\d+%|\bOK\b|^Successfully')
+
+# Number of trailing output lines kept from long-running commands (for error messages)
+OUTPUT_TAIL_LINES = 200
+
+# Size of the raw reads from the output pipe of long-running commands
+OUTPUT_READ_SIZE = 64 * 1024
+
+# Read size when hashing backups
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Random samples read from a backup to choose an "auto" compression level
+LEVEL_SAMPLE_COUNT = 16
+LEVEL_SAMPLE_SIZE = 64 * 1024
+
+# macOS fcntl(F_PREALLOCATE) constants from <sys/fcntl.h> (not exposed by the fcntl module)
+F_PREALLOCATE = 42
+F_ALLOCATECONTIG = 0x2
+F_ALLOCATEALL = 0x4
+F_PEOFPOSMODE = 3
+
+# Above this many expired files, cleanup deletes them from a pool of threads
+BULK_DELETE_THRESHOLD = 32
+BULK_DELETE_WORKERS = 16
+
+# Parsed config files keyed by absolute path: (st_mtime_ns, config)
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
+# Background thread writing queued log records to the log file and stdout
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flush queued log records, stop the log listener thread and close its handlers, if running."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        for handler in _LOG_LISTENER.handlers:
+            handler.close()
+        _LOG_LISTENER = None
+
+
+atexit.register(_stop_log_listener)
+
+
+def _preallocate(fd: int, length: int):
+    """Reserve length bytes of disk space for an output file on macOS.
+    
+    Best effort: the space is allocated in as few extents as possible up front
+    instead of growing the file piece by piece while a large archive is written.
+    Other platforms are skipped, since posix_fallocate is emulated by writing
+    every block on filesystems without native support (NFS, SMB).
+    """
+    if sys.platform != "darwin":
+        return
+    # fcntl(F_PREALLOCATE) with an fstore_t: flags, position mode, offset, length, bytes allocated
+    for flags in (F_ALLOCATECONTIG | F_ALLOCATEALL, F_ALLOCATEALL):
+        try:
+            fcntl.fcntl(fd, F_PREALLOCATE, struct.pack("Iiqqq", flags, F_PEOFPOSMODE, 0, length, 0))
+            return
+        except OSError as e:
+            error = e
+    logging.debug(f"Could not preallocate {length} bytes for output file: {error}")
+
+
+def _has_holes(path: Path) -> bool:
+    """Return True if a file is sparse (fewer blocks are allocated than its size needs)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return hasattr(st, "st_blocks") and st.st_blocks * 512 < st.st_size
+
+
+def _scan_expired_backups(directory, cutoff_ts: float, suffixes: Tuple[str, ...]) -> List[Tuple[str, int]]:
+    """Return (file name, size) of backup files in directory last modified before cutoff_ts.
+    
+    directory may be a path or an open directory descriptor. Only files whose
+    names end with one of suffixes are considered, and each is stat'ed once.
+    """
+    expired = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Skip non-backup files (include .mf files for cleanup) by name before touching metadata,
+            # then skip directories
+            if not entry.name.endswith(suffixes) or not entry.is_file():
+                continue
+            
+            stat_result = entry.stat(follow_symlinks=False)
+            if stat_result.st_mtime < cutoff_ts:
+                expired.append((entry.name, stat_result.st_size))
+    return expired
 
 
 class VirtualBoxBackup:
     """Main class for handling VirtualBox VM backups."""
     
+    # Supported compression formats and the archive suffix each one produces
+    COMPRESSION_FORMATS = {
+        "zstd": ".tar.zst",
+        "pigz": ".tar.gz",
+        "gz": ".tar.gz",
+    }
+    
+    # Levels used by "auto" compression_level, from cheapest to most thorough
+    AUTO_COMPRESSION_LEVELS = {
+        "zstd": (1, 3, 9),
+        "pigz": (1, 6, 9),
+        "gz": (1, 6, 9),
+    }
+    
+    # File name endings of everything a backup can leave in the backup directory
+    BACKUP_EXTENSIONS = ('.ova', '.ova.gz', '.tar.gz', '.tar.zst', '.zst', '.mf', '.sha256')
+    
+    # Default compression level for each format
+    DEFAULT_COMPRESSION_LEVELS = {
+        "zstd": 3,
+        "pigz": 6,
+        "gz": 6,
+    }
+    
+    # Valid compression_level range for each format (inclusive)
+    COMPRESSION_LEVEL_RANGES = {
+        "zstd": (1, 19),
+        "pigz": (1, 9),
+        "gz": (1, 9),
+    }
+    
     def __init__(self, config_path: str = "config.json"):
         """Initialize the backup manager with configuration."""
         # Get script directory to resolve relative paths
@@ -85,6 +238,21 @@ class VirtualBoxBackup:
                 error_msg = f"VBoxManage not executable: '{vboxmanage_path}' is not executable"
                 print(f"ERROR: {error_msg}", file=sys.stderr)
                 sys.exit(1)
+            full_path = vboxmanage_path
+        
+        # Use the resolved absolute path for every call so subprocess never searches PATH
+        self._vboxmanage = full_path
+        
+        # Settings read on every backup
+        self._handle_running = self.config["handle_running_vms"]
+        self._compression = self.config.get("compression", True)
+        
+        # Validate compression format
+        compression_format = self.config.get("compression_format", "zstd")
+        if compression_format not in self.COMPRESSION_FORMATS:
+            error_msg = f"Invalid compression_format '{compression_format}' (expected one of: {', '.join(self.COMPRESSION_FORMATS)})"
+            print(f"ERROR: {error_msg}", file=sys.stderr)
+            sys.exit(1)
         
         # Convert backup directory to absolute path
         backup_dir = self.config["backup_directory"]
@@ -92,6 +260,17 @@ class VirtualBoxBackup:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         logging.info(f"Backup directory: {self.backup_dir}")
         
+        # Cached VBoxManage query results to avoid spawning a process per lookup
+        self._vms_cache: Optional[List[Dict[str, str]]] = None
+        self._tar_is_gnu: Optional[bool] = None
+        
+        # Limits concurrent compressions when several VMs are backed up in parallel
+        self._compress_slots = threading.Semaphore(max(1, self.config.get("max_parallel_compress", 1)))
+        
+        # Per-VM locks so state changes (suspend/resume) never interleave across worker threads
+        self._vm_locks: Dict[str, threading.Lock] = {}
+        self._vm_locks_guard = threading.Lock()
+        
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file. Config file is required."""
         if not os.path.exists(config_path):
@@ -101,8 +280,17 @@ class VirtualBoxBackup:
             sys.exit(1)
         
         try:
+            # Reuse the parsed config if the file has not changed since it was last loaded
+            config_path = os.path.abspath(config_path)
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached and cached[0] == mtime_ns:
+                logging.info(f"Loaded configuration from {config_path} (cached)")
+                return copy.deepcopy(cached[1])
+            
             with open(config_path, 'r') as f:
                 config = json.load(f)
+            _CONFIG_CACHE[config_path] = (mtime_ns, copy.deepcopy(config))
             logging.info(f"Loaded configuration from {config_path}")
             return config
         except json.JSONDecodeError as e:
@@ -130,15 +318,28 @@ class VirtualBoxBackup:
             log_file_path = self.script_dir / log_file
         log_file_path = log_file_path.resolve()
         
+        # The thread name tells apart the interleaved output of VMs backed up in parallel
+        formatter = logging.Formatter('%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler(log_file_path),
+            logging.StreamHandler(sys.stdout)
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Worker threads only put records on a queue; a single listener thread does the
+        # file and console I/O, so parallel backups don't serialize on the handler locks
+        global _LOG_LISTENER
+        _stop_log_listener()
+        log_queue = queue.SimpleQueue()
         logging.basicConfig(
             level=getattr(logging, log_level, logging.INFO),
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file_path),
-                logging.StreamHandler(sys.stdout)
-            ],
+            format='%(message)s',  # Records are fully formatted by the listener's handlers
+            handlers=[logging.handlers.QueueHandler(log_queue)],
             force=True  # Force reconfiguration if logging was already set up
         )
+        _LOG_LISTENER = logging.handlers.QueueListener(log_queue, *handlers)
+        _LOG_LISTENER.start()
         logging.info(f"Logging to: {log_file_path}")
     
     def _run_command(self, command: List[str], show_progress: bool = False) -> Tuple[bool, str]:
@@ -146,7 +347,9 @@ class VirtualBoxBackup:
         
         Args:
             command: Command to run
-            show_progress: If True, show real-time output for long-running commands
+            show_progress: If True, show real-time output for long-running commands.
+                Only the last lines of output are kept for the returned output, so
+                memory stays constant however much the command prints.
         """
         try:
             if show_progress:
@@ -155,19 +358,40 @@ class VirtualBoxBackup:
                     command,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True
+                    bufsize=0
                 )
                 
-                output_lines = []
-                for line in process.stdout:
-                    line = line.rstrip()
-                    if line:
-                        print(line, flush=True)  # Show progress in real-time
-                        logging.info(line)  # Also log it
+                # Read raw bytes in large chunks and only decode the lines that are logged
+                fd = process.stdout.fileno()
+                debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+                output_lines = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+                pending = bytearray()
+                while True:
+                    data = os.read(fd, OUTPUT_READ_SIZE)
+                    if data:
+                        # Carriage returns end lines too, like in text mode
+                        pending += data.replace(b'\r', b'\n')
+                        *lines, rest = pending.split(b'\n')
+                        pending = bytearray(rest)
+                    else:
+                        lines = [bytes(pending)]
+                    for line in lines:
+                        line = line.rstrip()
+                        if not line:
+                            continue
+                        # Progress and status lines go to the log (and, through its stream handler, stdout);
+                        # anything else is only kept for the error message unless debugging
+                        if _PROGRESS_LINE_RE.search(line):
+                            logging.info(line.decode('utf-8', 'replace'))
+                        elif debug_enabled:
+                            logging.debug(line.decode('utf-8', 'replace'))
                         output_lines.append(line)
+                    if not data:
+                        break
+                process.stdout.close()
                 
                 process.wait()
-                output = '\n'.join(output_lines)
+                output = b'\n'.join(output_lines).decode('utf-8', 'replace')
                 return process.returncode == 0, output
             else:
                 # For quick commands, capture output normally
@@ -183,26 +407,45 @@ class VirtualBoxBackup:
             logging.error(f"Command execution error: {error_msg}")
             return False, error_msg
     
-    def list_vms(self) -> List[Dict[str, str]]:
-        """List all available VirtualBox VMs."""
-        vboxmanage = self.config["vboxmanage_path"]
-        success, output = self._run_command([vboxmanage, "list", "vms"])
+    def _run_command_capture(self, command: List[str]) -> Tuple[bool, bytes]:
+        """Run a quick command and return success status and its raw stdout.
+        
+        Output is kept as bytes so it can be parsed without decoding it all first.
+        If the command fails, its stderr is returned instead, for the error message.
+        """
+        try:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+        except Exception as e:
+            logging.error(f"Command execution error: {e}")
+            return False, str(e).encode()
+        if result.returncode != 0:
+            return False, result.stderr
+        return True, result.stdout
+    
+    @staticmethod
+    def _parse_vm_list(output: bytes) -> List[Dict[str, str]]:
+        """Parse the output of 'VBoxManage list vms'."""
+        return [{"name": match["name"].decode('utf-8', 'replace'), "uuid": match["uuid"].decode('ascii')}
+                for match in map(_VM_LINE_RE.match, output.splitlines()) if match]
+    
+    def list_vms(self, force_refresh: bool = False) -> List[Dict[str, str]]:
+        """List all available VirtualBox VMs (cached after the first successful call).
+        
+        Args:
+            force_refresh: If True, query VBoxManage again instead of using the cache
+        """
+        if self._vms_cache is not None and not force_refresh:
+            return list(self._vms_cache)
+        
+        vboxmanage = self._vboxmanage
+        success, output = self._run_command_capture([vboxmanage, "list", "vms"])
         
         if not success:
-            logging.error(f"Failed to list VMs: {output}")
+            logging.error(f"Failed to list VMs: {output.decode('utf-8', 'replace')}")
             return []
         
-        vms = []
-        for line in output.strip().split('\n'):
-            if line.strip():
-                # Format: "vm_name" {uuid}
-                parts = line.split('"')
-                if len(parts) >= 2:
-                    vm_name = parts[1]
-                    uuid = parts[-1].strip().strip('{}')
-                    vms.append({"name": vm_name, "uuid": uuid})
-        
-        return vms
+        self._vms_cache = self._parse_vm_list(output)
+        return list(self._vms_cache)
     
     def get_vms_to_backup(self) -> List[Dict[str, str]]:
         """Get list of VMs that should be backed up based on configuration."""
@@ -212,8 +455,8 @@ class VirtualBoxBackup:
             logging.warning("No VMs found")
             return []
         
-        vms_to_backup = self.config.get("vms_to_backup", [])
-        vms_to_exclude = self.config.get("vms_to_exclude", [])
+        vms_to_backup = set(self.config.get("vms_to_backup", []))
+        vms_to_exclude = set(self.config.get("vms_to_exclude", []))
         
         if vms_to_backup:
             # Only backup specified VMs
@@ -226,47 +469,57 @@ class VirtualBoxBackup:
     
     def _get_vm_state(self, vm_uuid: str) -> str:
         """Get the current state of a VM (running, paused, saved, poweredoff, etc.)."""
-        vboxmanage = self.config["vboxmanage_path"]
-        success, output = self._run_command([vboxmanage, "showvminfo", vm_uuid, "--machinereadable"])
+        # Always queried right before it is needed: a VM can be started or stopped while other VMs are backed up
+        vboxmanage = self._vboxmanage
+        success, output = self._run_command_capture([vboxmanage, "showvminfo", vm_uuid, "--machinereadable"])
         
         if not success:
-            logging.warning(f"Could not get VM state, output: {output}")
+            logging.warning(f"Could not get VM state, output: {output.decode('utf-8', 'replace')}")
             return "unknown"
         
-        # Parse machine-readable output for VMState
-        for line in output.split('\n'):
-            if line.startswith('VMState='):
-                state = line.split('=')[1].strip('"')
-                logging.debug(f"VM state detected: {state}")
-                return state
-        
-        # Fallback to parsing human-readable output
-        if "running" in output.lower():
-            return "running"
-        elif "paused" in output.lower():
-            return "paused"
-        elif "saved" in output.lower():
-            return "saved"
-        else:
-            return "poweredoff"
+        # --machinereadable output always has a VMState line, no need to guess from other text
+        match = _VMSTATE_RE.search(output)
+        if not match:
+            logging.warning(f"No VMState in showvminfo output for VM {vm_uuid}")
+            return "unknown"
+        state = match.group(1).decode('utf-8', 'replace')
+        logging.debug(f"VM state detected: {state}")
+        return state
+    
+    def _vm_lock(self, vm_uuid: str) -> threading.Lock:
+        """Get the lock guarding state changes of a VM."""
+        with self._vm_locks_guard:
+            return self._vm_locks.setdefault(vm_uuid, threading.Lock())
     
     def _suspend_vm(self, vm_uuid: str, vm_name: str) -> bool:
         """Suspend (save state) a running VM."""
-        vboxmanage = self.config["vboxmanage_path"]
+        vboxmanage = self._vboxmanage
         logging.info(f"Suspending VM {vm_name}...")
-        success, output = self._run_command([vboxmanage, "controlvm", vm_uuid, "savestate"])
+        with self._vm_lock(vm_uuid):
+            success, output = self._run_command([vboxmanage, "controlvm", vm_uuid, "savestate"])
         if success:
             logging.info(f"VM {vm_name} suspended successfully")
         else:
             logging.error(f"Failed to suspend VM {vm_name}: {output}")
         return success
     
-    def _resume_vm(self, vm_uuid: str, vm_name: str) -> bool:
-        """Resume/start a VM from saved or paused state."""
-        vboxmanage = self.config["vboxmanage_path"]
+    def _resume_vm(self, vm_uuid: str, vm_name: str, known_state: Optional[str] = None) -> bool:
+        """Resume/start a VM from saved or paused state.
+        
+        Args:
+            vm_uuid: UUID of the VM
+            vm_name: Name of the VM (for logging)
+            known_state: Current VM state if already known, avoids querying it again
+        """
+        with self._vm_lock(vm_uuid):
+            return self._resume_vm_locked(vm_uuid, vm_name, known_state)
+    
+    def _resume_vm_locked(self, vm_uuid: str, vm_name: str, known_state: Optional[str] = None) -> bool:
+        """Resume/start a VM; the caller must hold the VM's lock."""
+        vboxmanage = self._vboxmanage
         
         # Check current VM state to determine the correct command
-        vm_state = self._get_vm_state(vm_uuid)
+        vm_state = known_state or self._get_vm_state(vm_uuid)
         
         if vm_state == "saved":
             # VM was saved (suspended), need to start it to restore from saved state
@@ -298,168 +551,550 @@ class VirtualBoxBackup:
         """Backup a single VM."""
         vm_name = vm["name"]
         vm_uuid = vm["uuid"]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_filename = f"{vm_name}_{timestamp}.ova"
         backup_path = self.backup_dir / backup_filename
         
         logging.info(f"Starting backup of VM: {vm_name}")
         
-        vboxmanage = self.config["vboxmanage_path"]
-        
-        # Get VM state
+        # Get VM state once and pick the matching backup path
         vm_state = self._get_vm_state(vm_uuid)
         logging.info(f"VM {vm_name} current state: {vm_state}")
-        handle_running = self.config["handle_running_vms"]
-        
-        # Track if VM was originally running (to resume after backup)
-        was_running = False
-        
-        # Handle running VMs based on configuration
         if vm_state == "running":
-            logging.info(f"VM {vm_name} is running, handling according to 'handle_running_vms' setting: {handle_running}")
-            if handle_running == "suspend":
-                was_running = True  # Mark that we need to resume after backup
-                if not self._suspend_vm(vm_uuid, vm_name):
-                    logging.error(f"Cannot backup {vm_name}: failed to suspend VM")
-                    return False
-                # Wait for suspend (savestate) to complete and release disk locks
-                logging.info("Waiting for VM state to be saved and disk locks released...")
-                time.sleep(5)
-                # Verify VM is suspended
-                new_state = self._get_vm_state(vm_uuid)
-                if new_state != "saved":
-                    logging.warning(f"VM state after suspend is '{new_state}' (expected 'saved'), but proceeding...")
-            elif handle_running == "skip":
-                logging.warning(f"Skipping {vm_name}: VM is running and handle_running_vms is set to 'skip'")
-                return False
-            elif handle_running == "fail":
-                logging.error(f"Cannot backup {vm_name}: VM is running and handle_running_vms is set to 'fail'")
-                return False
-            else:
-                logging.warning(f"VM {vm_name} is running. Attempting backup anyway (may fail if disk is locked)...")
-        elif vm_state not in ["poweredoff", "saved", "paused", "aborted"]:
+            return self._backup_vm_running(vm, backup_path)
+        if vm_state not in ["poweroff", "poweredoff", "saved", "paused", "aborted"]:
             logging.warning(f"VM {vm_name} is in state '{vm_state}' which may have disk locks. Proceeding with backup...")
+        return self._backup_vm_offline(vm, backup_path)
+    
+    def _backup_vm_offline(self, vm: Dict[str, str], backup_path: Path) -> bool:
+        """Backup a VM that is not running: export, then compress."""
+        final_path = self._export_vm(vm, backup_path)
+        if final_path is None:
+            return False
+        return self._finish_backup(backup_path, final_path)
+    
+    def _backup_vm_running(self, vm: Dict[str, str], backup_path: Path) -> bool:
+        """Backup a running VM according to the 'handle_running_vms' setting."""
+        vm_name = vm["name"]
+        handle_running = self._handle_running
+        logging.info(f"VM {vm_name} is running, handling according to 'handle_running_vms' setting: {handle_running}")
+        if handle_running == "skip":
+            logging.warning(f"Skipping {vm_name}: VM is running and handle_running_vms is set to 'skip'")
+            return False
+        if handle_running == "fail":
+            logging.error(f"Cannot backup {vm_name}: VM is running and handle_running_vms is set to 'fail'")
+            return False
+        if handle_running != "suspend":
+            logging.warning(f"VM {vm_name} is running. Attempting backup anyway (may fail if disk is locked)...")
+            return self._backup_vm_offline(vm, backup_path)
+        
+        # The VM is resumed as soon as the export is done (before compression), even if it failed
+        with self._quiesced_vm(vm["uuid"], vm_name) as release_vm:
+            if release_vm is None:
+                logging.error(f"Cannot backup {vm_name}: failed to suspend VM")
+                return False
+            final_path = self._export_vm(vm, backup_path, on_export_done=release_vm)
+        
+        if final_path is None:
+            return False
+        return self._finish_backup(backup_path, final_path)
+    
+    def _export_vm(self, vm: Dict[str, str], backup_path: Path,
+                   on_export_done: Optional[Callable[[], None]] = None) -> Optional[Path]:
+        """Export a VM to backup_path, or stream it into a compressed OVA if enabled.
+        
+        Returns the path of the exported file, or None if the export failed.
+        on_export_done is called as soon as VBoxManage has finished with the disks.
+        """
+        vm_name = vm["name"]
         
-        # Export the VM - use absolute path to ensure backup goes to the right location
+        # Export the VM
         export_command = [
-            vboxmanage,
+            self._vboxmanage,
             "export",
-            vm_uuid,
-            "--output", str(backup_path.resolve())
+            vm["uuid"]
         ]
         
         # Add manifest option if enabled (default: True)
         # Manifest file contains SHA-1 checksums for integrity verification
-        manifest_enabled = self.config.get("include_manifest", True)
-        if manifest_enabled:
+        # It is redundant when a SHA-256 checksum file is written for the whole backup
+        checksum_enabled = self.config.get("sha256_checksum", False)
+        manifest_enabled = self.config.get("include_manifest", True) and not checksum_enabled
+        if checksum_enabled:
+            logging.info(f"Exporting VM {vm_name} to {backup_path} (SHA-256 checksum file replaces the manifest)")
+        elif manifest_enabled:
             export_command.append("--manifest")
             logging.info(f"Exporting VM {vm_name} to {backup_path} with manifest (integrity checksums)")
             manifest_path = backup_path.with_suffix('.mf')
-            if self.config.get("compression", True):
+            if self._compression:
                 logging.info(f"Manifest file will be created as {manifest_path.name} and included in compressed archive")
             else:
                 logging.info(f"Manifest file will be created as {manifest_path.name} alongside the OVA file")
         else:
             logging.info(f"Exporting VM {vm_name} to {backup_path}")
         
+        # Stream the export straight into the compressor if enabled (default: False)
+        stream_format = None
+        if self._compression and self.config.get("stream_compress", False):
+            stream_format = self._select_compression_format(require_command=True)
+            if stream_format == "gz" and not shutil.which("gzip"):
+                logging.warning("stream_compress requires zstd, pigz or gzip, exporting to an intermediate OVA file instead")
+                stream_format = None
+        
         logging.info("Starting export (this may take a while for large VMs)...")
-        logging.info(f"Backup will be saved to: {backup_path.resolve()}")
-        # Flush logs to ensure they're written
-        logging.getLogger().handlers[0].flush() if logging.getLogger().handlers else None
-        success, output = self._run_command(export_command, show_progress=True)
+        if stream_format:
+            final_path = backup_path.with_name(backup_path.name + (".zst" if stream_format == "zstd" else ".gz"))
+            logging.info(f"Backup will be streamed to: {final_path}")
+            # VBoxManage is done with the disks once it exits, so resume while the compressor drains
+            success, output = self._export_streamed(export_command, backup_path.name, stream_format, final_path,
+                                                    on_export_done=on_export_done)
+        else:
+            # Use absolute path to ensure backup goes to the right location
+            final_path = backup_path.resolve()
+            logging.info(f"Backup will be saved to: {final_path}")
+            success, output = self._run_command(export_command + ["--output", str(final_path)], show_progress=True)
         
         if not success:
             logging.error(f"Failed to export VM {vm_name}: {output}")
-            return False
+            return None
+        
+        logging.info(f"Successfully backed up {vm_name} to {final_path}")
+        return final_path
+    
+    def _finish_backup(self, backup_path: Path, final_path: Path) -> bool:
+        """Compress an exported OVA (unless it was compressed while streaming) and write its checksum."""
+        # Compress if enabled (after VM is resumed), unless already compressed while streaming
+        if self._compression and final_path.name == backup_path.name:
+            # Each compressor already uses all cores, so limit how many run at once
+            with self._compress_slots:
+                final_path = self._compress_backup(backup_path)
+        
+        if self.config.get("sha256_checksum", False):
+            self._write_checksum(final_path)
+        
+        return True
+    
+    @contextlib.contextmanager
+    def _quiesced_vm(self, vm_uuid: str, vm_name: str):
+        """Keep a VM suspended for the duration of a with-block.
+        
+        Yields a callable that resumes the VM early, e.g. as soon as VBoxManage has
+        finished reading its disks. The VM is resumed on exit in any case, so a
+        failed export never leaves it suspended. Yields None if suspending failed.
+        """
+        if not self._suspend_vm(vm_uuid, vm_name):
+            yield None
+            return
         
-        logging.info(f"Successfully backed up {vm_name} to {backup_path}")
+        # Wait for suspend (savestate) to complete and release disk locks
+        logging.info("Waiting for VM state to be saved and disk locks released...")
+        start = time.monotonic()
+        deadline = start + self.config.get("suspend_timeout_seconds", 60)
+        delay = 0.1
+        # Poll with exponential backoff instead of a fixed delay (savestate usually finishes at once)
+        new_state = self._get_vm_state(vm_uuid)
+        while new_state != "saved" and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+            new_state = self._get_vm_state(vm_uuid)
+        logging.info(f"Waited {time.monotonic() - start:.1f}s for VM {vm_name} to be saved")
+        if new_state != "saved":
+            logging.warning(f"VM state after suspend is '{new_state}' (expected 'saved'), but proceeding...")
+        # Exporting doesn't change the state, so a verified 'saved' state can be reused when resuming
+        known_state = "saved" if new_state == "saved" else None
         
-        # Resume VM if it was running before backup (do this before compression)
-        if was_running and self.config.get("resume_after_backup", True):
+        released = False
+        
+        def release():
+            nonlocal released
+            if released or not self.config.get("resume_after_backup", True):
+                return
+            released = True
             logging.info(f"Resuming VM {vm_name} (was running before backup)...")
-            if not self._resume_vm(vm_uuid, vm_name):
-                logging.warning(f"Backup completed successfully, but failed to resume VM {vm_name}")
-                # Don't fail the backup if resume fails - backup was successful
-            else:
+            if self._resume_vm(vm_uuid, vm_name, known_state):
                 logging.info(f"VM {vm_name} resumed successfully after backup")
+            else:
+                # Don't fail the backup if resume fails
+                logging.warning(f"Failed to resume VM {vm_name} after backup")
         
-        # Compress if enabled (after VM is resumed)
-        if self.config.get("compression", True):
-            self._compress_backup(backup_path)
+        try:
+            yield release
+        finally:
+            release()
+    
+    def _export_streamed(self, export_command: List[str], ova_name: str, compression_format: str,
+                         compressed_path: Path, on_export_done: Optional[Callable[[], None]] = None) -> Tuple[bool, str]:
+        """Export a VM straight into the compressor without an intermediate OVA file.
         
-        return True
+        VBoxManage chooses the export format from the output file extension, so
+        it writes to a named pipe called like the OVA rather than to /dev/stdout.
+        on_export_done is called once VBoxManage has exited, before waiting for
+        the compressor to finish.
+        """
+        with tempfile.TemporaryDirectory() as fifo_dir:
+            fifo_path = os.path.join(fifo_dir, ova_name)
+            os.mkfifo(fifo_path)
+            
+            # Let the shell open the pipe so we never block if VBoxManage fails before opening it
+            compressor = self._compressor_command(compression_format, self._compression_level(compression_format))
+            with open(compressed_path, 'wb') as output_file:
+                compress_process = subprocess.Popen(
+                    ["/bin/sh", "-c", 'exec "$@" < "$0"', fifo_path] + compressor,
+                    stdout=output_file
+                )
+            
+            success, output = self._run_command(export_command + ["--output", fifo_path], show_progress=True)
+            if on_export_done:
+                on_export_done()
+            if not success:
+                compress_process.kill()
+            compress_process.wait()
+        
+        if success and compress_process.returncode != 0:
+            success = False
+            output = f"{compressor[0]} exited with status {compress_process.returncode}"
+        if not success and compressed_path.exists():
+            compressed_path.unlink()
+        return success, output
+    
+    def _select_compression_format(self, require_command: bool = False) -> str:
+        """Return the configured compression format, falling back to what is installed.
+        
+        zstd falls back to pigz, and pigz falls back to Python's built-in gzip.
+        Without the zstd command, zstd compression uses the optional zstandard
+        module instead, unless require_command is set (for streamed exports).
+        """
+        compression_format = self.config.get("compression_format", "zstd")
+        if compression_format == "zstd" and not shutil.which("zstd"):
+            if zstandard is not None and not require_command:
+                logging.info("zstd not found in PATH, using the zstandard Python module")
+            else:
+                logging.warning("zstd not found in PATH, falling back to gzip compression")
+                compression_format = "pigz"
+        if compression_format == "pigz" and not shutil.which("pigz"):
+            logging.info("pigz not found in PATH, using single-threaded gzip")
+            compression_format = "gz"
+        return compression_format
+    
+    def _compression_level(self, compression_format: str, sample: Optional[bytes] = None) -> int:
+        """Get the configured compression level, choosing one from the data if set to "auto".
+        
+        A configured level is only used with the configured format; if the format
+        fell back to another compressor, or the level is out of range for it, the
+        format's default level is used instead.
+        """
+        default_level = self.DEFAULT_COMPRESSION_LEVELS[compression_format]
+        level = self.config.get("compression_level", default_level)
+        if level != "auto":
+            min_level, max_level = self.COMPRESSION_LEVEL_RANGES[compression_format]
+            if compression_format != self.config.get("compression_format", "zstd") and "compression_level" in self.config:
+                logging.warning(f"compression_level {level} was set for {self.config.get('compression_format', 'zstd')}, "
+                                f"using the {compression_format} default level {default_level} instead")
+                return default_level
+            if not isinstance(level, int) or isinstance(level, bool) or not min_level <= level <= max_level:
+                logging.warning(f"Invalid compression_level {level!r} for {compression_format} "
+                                f"(expected {min_level}-{max_level} or \"auto\"), using default level {default_level}")
+                return default_level
+            return level
+        # Streamed exports have no file to sample before compression starts
+        if not sample:
+            return default_level
+        return self._choose_compression_level(sample, compression_format)
+    
+    def _sample_backup(self, backup_path: Path) -> bytes:
+        """Read random samples of the backup (about 1 MiB) to estimate how well it compresses."""
+        try:
+            file_size = backup_path.stat().st_size
+            with open(backup_path, 'rb') as f:
+                if file_size <= LEVEL_SAMPLE_COUNT * LEVEL_SAMPLE_SIZE:
+                    return f.read()
+                chunks = []
+                for offset in sorted(random.randrange(file_size - LEVEL_SAMPLE_SIZE) for _ in range(LEVEL_SAMPLE_COUNT)):
+                    f.seek(offset)
+                    chunks.append(f.read(LEVEL_SAMPLE_SIZE))
+                return b''.join(chunks)
+        except Exception as e:
+            logging.warning(f"Could not sample {backup_path.name} to estimate its compressibility: {e}")
+            return b''
+    
+    def _choose_compression_level(self, sample: bytes, compression_format: str) -> int:
+        """Pick a compression level from how well samples of the backup compress.
+        
+        The samples are compressed with zlib at low, medium and high effort; the
+        first tier whose next tier saves less than 5% more of the size is used.
+        """
+        ratios = [len(zlib.compress(sample, zlib_level)) / len(sample) for zlib_level in (1, 6, 9)]
+        tier = 0
+        while tier < len(ratios) - 1 and ratios[tier] - ratios[tier + 1] >= 0.05:
+            tier += 1
+        
+        level = self.AUTO_COMPRESSION_LEVELS[compression_format][tier]
+        logging.info(f"Sampled compression ratios {', '.join(f'{r:.2f}' for r in ratios)}, using level {level}")
+        return level
     
-    def _compress_backup(self, backup_path: Path):
-        """Compress a backup file using tar.gz, including manifest file if present."""
+    def _compressor_command(self, compression_format: str, level: int) -> List[str]:
+        """Build the zstd, pigz or gzip command line that compresses stdin to stdout."""
+        threads = self.config.get("compression_threads") or os.cpu_count() or 1
+        logging.info(f"Compressing with {compression_format} level {level} using {threads} thread(s)")
+        
+        if compression_format == "zstd":
+            command = [shutil.which("zstd"), f"-T{threads}", f"-{level}", "--long=27", "-c"]
+            if self.config.get("zstd_adapt", True):
+                # Start at the configured level and let zstd lower or raise it to keep up with disk I/O,
+                # so little CPU is spent on already-compressed disk data
+                command.append("--adapt")
+            return command
+        if compression_format == "pigz":
+            return [shutil.which("pigz"), "-p", str(threads), f"-{level}", "-c"]
+        # Single-threaded system gzip, only used for streamed exports
+        return [shutil.which("gzip"), f"-{level}", "-c"]
+    
+    def _compress_backup(self, backup_path: Path) -> Path:
+        """Compress a backup file into a tar archive, including manifest file if present.
+        
+        The archive is compressed with multi-threaded zstd or pigz through the
+        system tar when available, otherwise with Python's tarfile module.
+        Returns the path of the archive, or of the original file if it was not compressed.
+        """
         if not backup_path.exists():
-            return
+            return backup_path
+        
+        # VirtualBox already compresses the disk images inside the OVA, so compressing
+        # them again often costs a lot of CPU time for next to no space saved
+        min_ratio = self.config.get("compression_min_ratio", 0.9)
+        sample = b''
+        if min_ratio is not None or self.config.get("compression_level") == "auto":
+            sample = self._sample_backup(backup_path)
+        if sample and min_ratio is not None:
+            ratio = len(zlib.compress(sample, 1)) / len(sample)
+            if ratio > min_ratio:
+                logging.info(f"Skipping compression of {backup_path.name}: data is incompressible "
+                             f"(sample compresses to {ratio:.0%} of its size)")
+                return backup_path
         
-        compressed_path = backup_path.with_suffix('.tar.gz')
+        compression_format = self._select_compression_format()
+        compressed_path = backup_path.with_suffix(self.COMPRESSION_FORMATS[compression_format])
+        manifest_path = backup_path.with_suffix('.mf')
         logging.info(f"Compressing {backup_path} to {compressed_path}")
         
+        # Include the manifest file if it exists (when --manifest option was used)
+        members = [backup_path]
+        if manifest_path.exists():
+            members.append(manifest_path)
+            logging.info(f"Including manifest file {manifest_path.name} in compressed archive")
+        else:
+            logging.info("No manifest file found (manifest may be disabled in config)")
+        
+        level = self._compression_level(compression_format, sample)
+        if compression_format == "gz":
+            success = self._compress_with_tarfile(members, compressed_path, level)
+        elif compression_format == "zstd" and not shutil.which("zstd"):
+            success = self._compress_with_zstandard(members, compressed_path, level)
+        else:
+            compressor = self._compressor_command(compression_format, level)
+            success = self._compress_with_tar(compressor, members, compressed_path)
+        
+        if not success:
+            # Keep original files if compression fails
+            if compressed_path.exists():
+                compressed_path.unlink()
+            return backup_path
+        
+        # Remove original files after successful compression
+        for member in members:
+            member.unlink()
+        logging.info(f"Compression complete. Original files removed. Manifest is included in {compressed_path.name}")
+        return compressed_path
+    
+    def _compress_with_tar(self, compressor: List[str], members: List[Path], compressed_path: Path) -> bool:
+        """Create a compressed archive by piping the system tar into an external compressor.
+        
+        Equivalent to 'tar -cf - members | compressor > compressed_path', with the
+        exit status of both processes checked.
+        """
+        # "--" keeps member names starting with "-" (VMs named like "-db") from being read as options
+        tar_command = ["tar", "-cf", "-", "-C", str(members[0].parent), "--"] + [member.name for member in members]
+        if self._tar_sparse_supported() and any(_has_holes(member) for member in members):
+            # Only store the allocated parts of thin-provisioned files, so the runs
+            # of zeros in the holes never reach the compressor
+            tar_command.insert(1, "--sparse")
         try:
-            # Create a tar.gz archive
-            with tarfile.open(compressed_path, 'w:gz') as tar:
-                # Add the OVA file
-                tar.add(backup_path, arcname=backup_path.name)
+            with open(compressed_path, 'wb') as output_file:
+                # The archive is at most about as large as the data in its input, so reserve that much
+                # space (holes in sparse files take up no space, so count allocated blocks)
+                _preallocate(output_file.fileno(), sum(min(st.st_blocks * 512, st.st_size)
+                                                       for st in (member.stat() for member in members)))
+                tar_process = subprocess.Popen(tar_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                compress_process = subprocess.Popen(
+                    compressor,
+                    stdin=tar_process.stdout,
+                    stdout=output_file,
+                    stderr=subprocess.PIPE
+                )
+                # Close our end of the pipe so the compressor is the only reader
+                tar_process.stdout.close()
                 
-                # If manifest file exists (when --manifest option was used), include it
-                manifest_path = backup_path.with_suffix('.mf')
-                if manifest_path.exists():
-                    tar.add(manifest_path, arcname=manifest_path.name)
-                    logging.info(f"Including manifest file {manifest_path.name} in compressed archive")
-                else:
-                    logging.info("No manifest file found (manifest may be disabled in config)")
-            
-            # Remove original files after successful compression
-            backup_path.unlink()
-            manifest_path = backup_path.with_suffix('.mf')
-            if manifest_path.exists():
-                manifest_path.unlink()
-            logging.info(f"Compression complete. Original files removed. Manifest is included in {compressed_path.name}")
+                compress_errors = compress_process.stderr.read()
+                compress_process.wait()
+                tar_errors = tar_process.stderr.read()
+                tar_process.wait()
+                
+                # The compressor shares our file offset, so it marks the end of the archive;
+                # cut off the unused preallocated space
+                output_file.truncate(os.lseek(output_file.fileno(), 0, os.SEEK_CUR))
         except Exception as e:
             logging.error(f"Failed to compress backup: {e}")
-            # Keep original file if compression fails
+            return False
+        
+        # Check the compressor first: if it dies, tar only reports a broken pipe
+        if compress_process.returncode != 0:
+            logging.error(f"Failed to compress backup: {compressor[0]} exited with status {compress_process.returncode}: {compress_errors.decode(errors='replace')}")
+            return False
+        if tar_process.returncode != 0:
+            logging.error(f"Failed to compress backup: tar exited with status {tar_process.returncode}: {tar_errors.decode(errors='replace')}")
+            return False
+        return True
+    
+    def _tar_sparse_supported(self) -> bool:
+        """Check (once) whether the system tar is GNU tar, which needs --sparse to detect holes.
+        
+        bsdtar, the macOS default, already stores sparse files efficiently on its own.
+        """
+        if self._tar_is_gnu is None:
+            success, output = self._run_command(["tar", "--version"])
+            self._tar_is_gnu = success and "GNU tar" in output
+        return self._tar_is_gnu
+    
+    def _compress_with_zstandard(self, members: List[Path], compressed_path: Path, level: int) -> bool:
+        """Create a tar.zst archive with the zstandard module (when the zstd command is missing)."""
+        import tarfile
+        
+        threads = self.config.get("compression_threads") or os.cpu_count() or 1
+        logging.info(f"Compressing with zstd level {level} using {threads} thread(s)")
+        try:
+            compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+            with open(compressed_path, 'wb', buffering=COMPRESS_BUFFER_SIZE) as raw_file, \
+                    compressor.stream_writer(raw_file) as zstd_file, \
+                    tarfile.open(fileobj=zstd_file, mode='w|') as tar:
+                tar.copybufsize = COMPRESS_BUFFER_SIZE
+                for member in members:
+                    tar.add(member, arcname=member.name)
+            return True
+        except Exception as e:
+            logging.error(f"Failed to compress backup: {e}")
+            return False
+    
+    def _compress_with_tarfile(self, members: List[Path], compressed_path: Path, level: int) -> bool:
+        """Create a tar.gz archive with Python's tarfile module (portable fallback)."""
+        # Only imported when needed, most backups are compressed by external tools
+        import gzip
+        import tarfile
+        
+        try:
+            # Use a large write buffer instead of tarfile's 'w:gz' default to cut down on write calls
+            with open(compressed_path, 'wb', buffering=COMPRESS_BUFFER_SIZE) as raw_file, \
+                    gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=level) as gzip_file, \
+                    tarfile.open(fileobj=gzip_file, mode='w') as tar:
+                # Copy member data in large chunks instead of tarfile's default 16 KiB (Python 3.8+)
+                tar.copybufsize = COMPRESS_BUFFER_SIZE
+                for member in members:
+                    tar.add(member, arcname=member.name)
+            return True
+        except Exception as e:
+            logging.error(f"Failed to compress backup: {e}")
+            return False
+    
+    def _write_checksum(self, backup_path: Path):
+        """Write a SHA-256 checksum file next to a backup (verify with 'shasum -a 256 -c')."""
+        checksum_path = backup_path.with_name(backup_path.name + '.sha256')
+        logging.info(f"Computing SHA-256 checksum of {backup_path.name}")
+        
+        try:
+            with open(backup_path, 'rb') as f:
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: hashes in C without a Python-level read loop
+                    digest = hashlib.file_digest(f, "sha256")
+                else:
+                    digest = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                        digest.update(chunk)
+            checksum_path.write_text(f"{digest.hexdigest()}  {backup_path.name}\n")
+            logging.info(f"Checksum written to {checksum_path.name}")
+        except Exception as e:
+            logging.error(f"Failed to write checksum for {backup_path.name}: {e}")
+    
+    def _delete_backups(self, expired: List[Tuple[str, int]], dir_fd: Optional[int]) -> Tuple[int, int]:
+        """Delete backup files by name, returning the number of deleted files and bytes freed.
+        
+        Large batches are unlinked from a pool of threads, so the per-file latency
+        of slow or network-mounted backup drives overlaps instead of adding up.
+        """
+        def delete(entry: Tuple[str, int]) -> Tuple[str, Optional[int]]:
+            return self._safe_unlink(entry[0], entry[1], dir_fd)
+        
+        if len(expired) > BULK_DELETE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=BULK_DELETE_WORKERS) as executor:
+                results = list(executor.map(delete, expired))
+        else:
+            results = [delete(entry) for entry in expired]
+        
+        deleted = [file_size for _, file_size in results if file_size is not None and file_size >= 0]
+        return len(deleted), sum(deleted)
+    
+    def _safe_unlink(self, name: str, file_size: int, dir_fd: Optional[int]) -> Tuple[str, Optional[int]]:
+        """Delete one backup file, returning its name and size.
+        
+        The size is None if the file was already gone, and -1 if deleting it failed.
+        """
+        try:
+            os.unlink(name if dir_fd is not None else str(self.backup_dir / name), dir_fd=dir_fd)
+        except FileNotFoundError:
+            return name, None  # Already removed by someone else, not counted as deleted by this run
+        except Exception as e:
+            logging.error(f"Failed to delete {name}: {e}")
+            return name, -1
+        logging.debug(f"Deleted old backup: {name} ({file_size / (1024**3):.2f} GB)")
+        return name, file_size
     
     def cleanup_old_backups(self):
         """Remove backups older than retention period."""
         retention_days = self.config.get("retention_days", 30)
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        cutoff_ts = time.time() - retention_days * 24 * 60 * 60
         
-        logging.info(f"Cleaning up backups older than {retention_days} days (before {cutoff_date.strftime('%Y-%m-%d')})")
+        logging.info(f"Cleaning up backups older than {retention_days} days (before {time.strftime('%Y-%m-%d', time.localtime(cutoff_ts))})")
         
-        deleted_count = 0
-        freed_space = 0
+        # scandir reuses the directory entry metadata, so each backup needs a single stat call.
+        # Where supported, scan and unlink relative to an open directory descriptor so each
+        # file is handled with fstatat/unlinkat instead of resolving its full path again.
+        dir_fd = None
+        if os.scandir in os.supports_fd and os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(self.backup_dir, os.O_RDONLY)
         
-        for backup_file in self.backup_dir.iterdir():
-            if not backup_file.is_file():
-                continue
-            
-            # Skip non-backup files (include .mf files for cleanup)
-            if not (backup_file.suffix in ['.ova', '.tar.gz', '.mf'] or 
-                    backup_file.name.endswith('.ova') or 
-                    backup_file.name.endswith('.tar.gz') or
-                    backup_file.name.endswith('.mf')):
-                continue
-            
-            # Get file modification time
-            file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-            
-            if file_mtime < cutoff_date:
-                file_size = backup_file.stat().st_size
-                try:
-                    backup_file.unlink()
-                    deleted_count += 1
-                    freed_space += file_size
-                    logging.info(f"Deleted old backup: {backup_file.name} ({file_size / (1024**3):.2f} GB)")
-                except Exception as e:
-                    logging.error(f"Failed to delete {backup_file.name}: {e}")
+        try:
+            expired = _scan_expired_backups(self.backup_dir if dir_fd is None else dir_fd,
+                                            cutoff_ts, self.BACKUP_EXTENSIONS)
+            deleted_count, freed_space = self._delete_backups(expired, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
         
         if deleted_count > 0:
             logging.info(f"Cleanup complete: Deleted {deleted_count} backup(s), freed {freed_space / (1024**3):.2f} GB")
         else:
             logging.info("No old backups to clean up")
     
+    def _backup_vm_safely(self, vm: Dict[str, str]) -> bool:
+        """Backup a single VM, counting an unexpected error as a failed backup.
+        
+        One VM failing this way must not abort the backups of the other VMs
+        or the cleanup that follows them.
+        """
+        try:
+            return self.backup_vm(vm)
+        except Exception as e:
+            logging.error(f"Backup of VM {vm['name']} failed: {e}")
+            return False
+    
     def run_backup(self):
         """Run the complete backup process."""
         logging.info("=" * 60)
@@ -474,14 +1109,18 @@ class VirtualBoxBackup:
         
         logging.info(f"Found {len(vms)} VM(s) to backup")
         
-        successful = 0
-        failed = 0
+        # VMs are independent, so back up several at once (each export is its own VBoxManage process)
+        max_parallel = max(1, self.config.get("max_parallel_vms", 2))
+        if max_parallel == 1 or len(vms) == 1:
+            results = [self._backup_vm_safely(vm) for vm in vms]
+        else:
+            logging.info(f"Backing up up to {min(max_parallel, len(vms))} VM(s) in parallel")
+            with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="backup") as executor:
+                futures = [executor.submit(self._backup_vm_safely, vm) for vm in vms]
+                results = [future.result() for future in as_completed(futures)]
         
-        for vm in vms:
-            if self.backup_vm(vm):
-                successful += 1
-            else:
-                failed += 1
+        successful = results.count(True)
+        failed = len(results) - successful
         
         logging.info(f"Backup process complete: {successful} successful, {failed} failed")
         
@@ -494,6 +1133,8 @@ class VirtualBoxBackup:
 
 def main():
     """Main entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="VirtualBox Automatic VM Backup Script"
     )
@@ -526,7 +1167,7 @@ def main():
         print("Validating configuration...")
         print(f"✓ Config file loaded: {args.config}")
         print(f"✓ Required config keys present")
-        print(f"✓ VBoxManage path validated: {backup_manager.config['vboxmanage_path']}")
+        print(f"✓ VBoxManage path validated: {backup_manager._vboxmanage}")
         
         # Test VBoxManage access
         print("\nTesting VBoxManage access...")